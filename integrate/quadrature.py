@@ -92,6 +92,12 @@ class IterativeTrapz(IterativeProcess):
 	#users usually override the following methods
 	def default_criterion(self):
 		return AbsDiff(precision=1.5e-8, maxiter=100)
+	def record_history(self, value=None):
+		'''Return None.
+		`iterate` refines the last recorded area, so keep them all.
+		'''
+		if value is not None:
+			self.history.append(value)
 	#users must implement the following methods
 	def iterate(self):
 		"""Return float,
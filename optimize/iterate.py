@@ -14,7 +14,23 @@ __docformat__ = "restructuredtext en"
 __author__ = 'Alan G. Isaac (and others as specified)'
 __lastmodified__ = '2007-07-04'
 
+import logging
+from array import array
 
+have_numba = False
+try:
+	import numba
+	have_numba = True
+	logging.info("have_numba is True")
+except ImportError:
+	logging.info("Numba not available.")
+
+
+def _func(method):
+	'''Return: the function underlying `method`
+	(an unbound method in Python 2).
+	'''
+	return getattr(method, '__func__', method)
 
 class IterativeProcess(object):
 	'''General description of iterative process.
@@ -42,13 +58,31 @@ class IterativeProcess(object):
 		else:
 			self.criterion = criterion
 	def run(self):
+		'''Return: None.
+		Iterate until the criterion is satisfied.
+		Same steps as iterating over `self`, but with no per-step
+		`next` dispatch, and with no call to `record_history`
+		unless a subclass overrides it.
+		'''
+		iterate = self.iterate
 		criterion = self.criterion
 		reportfreq = self.reportfreq #printed output
+		record = None
+		if _func(type(self).record_history) is not _func(IterativeProcess.record_history):
+			record = self.record_history
+		i = self.iteration
 		#iterate while criterion not satisfied
-		for badvalue in self:
-			self.value = badvalue
-			self.record_history(value=badvalue)
-			if (reportfreq and not self.iteration%reportfreq):
+		while True:
+			value = iterate()
+			i += 1
+			self.iteration = i
+			if criterion(self, value=value, iteration=i):
+				self.finalize(value=value)
+				break
+			self.value = value
+			if record is not None:
+				record(value=value)
+			if (reportfreq and not i%reportfreq):
 				print self.report()
 	def report(self):
 		'''Return: string.
@@ -68,9 +102,10 @@ class IterativeProcess(object):
 	def record_history(self, value=None):
 		'''Should return: None.
 		Must be able to handle initial state.
+		Does nothing by default: override to keep a history
+		(e.g., append `value` to `self.history`).
 		'''
-		if value is not None:
-			self.history.append(value)
+		pass
 	def finalize(self, value=None):
 		'''Return: None.
 		Should set self.value to final value!
@@ -166,8 +201,23 @@ def abisect(a, i1=0, i2=-1):
 			i2 = midpt
 	return max(i1,i2)
 
+def _bisect_step(xneg, xpos, f):
+	'''Return: xneg, xpos, xmid,
+	the sign changing interval after one bisection step
+	and the midpoint that was tested.
+	'''
+	xmid = (xneg + xpos)/2.0
+	if f(xmid) > 0:
+		xpos = xmid
+	else:
+		xneg = xmid
+	return xneg, xpos, xmid
+
+if have_numba:
+	_bisect_step_nb = numba.njit(cache=True)(_bisect_step)
+
 class Bisect(IterativeProcess):
-	def __init__(self, func, x1, x2, criterion=None):
+	def __init__(self, func, x1, x2, criterion=None, jit=False):
 		'''Return: None.
 		Initialize the bisection iterative process.
 
@@ -187,9 +237,13 @@ class Bisect(IterativeProcess):
 			  one side of a sign changing interval
 			criterion : StopIter
 			  convergence criterion
+			jit : bool
+			  if True and Numba is available, compile the bisection step
+			  (`f` must then be a Numba-compiled function)
 		'''
 		IterativeProcess.__init__(self, criterion)  #TODO
 		self.func = func
+		self._step = _bisect_step_nb if (jit and have_numba) else _bisect_step
 		f1, f2 = func(x1), func(x2)
 		if f1 < 0 < f2:
 			self.x_neg, self.x_pos = x1, x2
@@ -197,54 +251,106 @@ class Bisect(IterativeProcess):
 			self.x_neg, self.x_pos = x2, x1
 		else:
 			raise ValueError("[%f,%f] is not a sign changing interval."%(x1,x2))
-		self.history = [x1, x2]
+		#flat buffer of (x_neg, x_pos) pairs: no tuple per iteration
+		self.history = array('d')
+		self.record_history()
 	#overriding the following methods
 	def default_criterion(self):
-		return (lambda x, value, iteration: abs(x[1] - x[0]) < 1e-9) #TODO
+		return (lambda ip, value, iteration: abs(ip.x_pos - ip.x_neg) < 1e-9) #TODO
+	def record_history(self, value=None):
+		'''Return: None.
+		Append the current interval to `history`, so that
+		``history[2*i:2*i+2]`` is (x_neg, x_pos) after iteration i.
+		'''
+		append = self.history.append
+		append(self.x_neg)
+		append(self.x_pos)
 	def finalize(self, value=None):
+		self.record_history()
 		self.value = (self.x_neg + self.x_pos)/2.0
 	#implementing the following methods
 	def iterate(self):
-		midpt = (self.x_neg + self.x_pos)/2.0
-		if self.func(midpt) > 0:
-			self.x_pos = midpt
-		else:
-			self.x_neg = midpt
+		self.x_neg, self.x_pos, midpt = self._step(self.x_neg, self.x_pos, self.func)
 		return midpt
 	def get_testinfo(self, value=None, iteration=0):
-		#return (self.x_neg , self.x_pos)
-		return self.history[-1], value
+		return self.x_neg, self.x_pos
 
 
 
 
 
 
-#BEGIN cx:optimize.bisect
-def bisect(f, x1, x2, eps=1e-8):
+def bisect(f, x1, x2, eps=1e-8, jit=False):
 	'''Return: a zero of `f`.
 	(Simple implementation of bisection algorithm.)
 
 	:parameters:
 		f : real-valued function
 		x1, x2 : sign changing interval
-		eps : convergence criterion
+		eps : convergence criterion,
+		  relative to the size of the initial interval endpoints
+		jit : bool
+		  if True and Numba is available, run a compiled loop
+		  (`f` must then be a Numba-compiled function)
 	'''
+	if jit and have_numba:
+		return _bisect_nb(f, float(x1), float(x2), float(eps))
+	return _bisect(f, x1, x2, eps)
+
+#BEGIN cx:optimize.bisect
+def _bisect(f, x1, x2, eps):
 	#require: sign change over initial interval
 	f1, f2 = f(x1), f(x2)
 	if f1*f2 > 0:
 		raise ValueError('supply a sign changing interval')
 	#initialize xneg, xpos
 	xneg, xpos = (x1,x2) if(f2>0) else (x2,x1)
-	while xpos-xneg > eps:
+	#relative tolerance, computed once
+	eps_scaled = eps * max(1.0, abs(x1)+abs(x2))
+	while abs(xpos-xneg) > eps_scaled:
 		xmid = (xneg+xpos)/2
-		if f(xmid) > 0:
-			xpos = xmid
-		else:
-			xneg = xmid
+		#branchless update: s is 1 if f(xmid) > 0 else 0
+		s = (f(xmid) > 0.0) * 1.0
+		xpos = s*xmid + (1-s)*xpos
+		xneg = (1-s)*xmid + s*xneg
 	return (xneg+xpos)/2
 #END cx:optimize.bisect
 
+if have_numba:
+	_bisect_nb = numba.njit(cache=True)(_bisect)
+
+def bisect_batch(f_vec, x1, x2, eps=1e-8, maxit=100):
+	'''Return: array, a zero of `f_vec` in each of many intervals.
+	Bisects all the intervals at once, so that `f_vec` is
+	called once per iteration (on an array of midpoints).
+
+	:parameters:
+		f_vec : function
+		  vectorized real-valued function (array in, array out)
+		x1, x2 : arrays
+		  endpoints of the sign changing intervals
+		eps : convergence criterion (for the widest interval)
+		maxit : maximum number of iterations
+	:requires: NumPy
+	'''
+	import numpy as np
+	x1 = np.asarray(x1, dtype=np.float64)
+	x2 = np.asarray(x2, dtype=np.float64)
+	f1, f2 = f_vec(x1), f_vec(x2)
+	if np.any(f1*f2 > 0):
+		raise ValueError('supply sign changing intervals')
+	#initialize xneg, xpos
+	xneg = np.where(f2>0, x1, x2)
+	xpos = np.where(f2>0, x2, x1)
+	for _ in range(maxit):
+		xmid = 0.5*(xneg+xpos)
+		pos = f_vec(xmid) > 0
+		np.copyto(xpos, xmid, where=pos)
+		np.copyto(xneg, xmid, where=~pos)
+		if np.max(np.abs(xpos-xneg)) < eps:
+			break
+	return 0.5*(xneg+xpos)
+
 
 
 #BEGIN: stop criteria #########################################################
@@ -28,7 +28,8 @@ if have_numpy:
 	import numpy as np
 	import numpy.linalg as la
 if have_scipy:
-	from scipy import stats as Sstats
+	from scipy.linalg import cholesky, cho_factor, cho_solve, solve_triangular
+	from scipy.linalg.lapack import dgels
 
 import random, math, operator
 import types
@@ -36,9 +37,82 @@ import sys,os
 import logging
 logging.basicConfig(level=logging.WARN)
 import time
+from collections import namedtuple
 
+_LOG_2PI = math.log(2*math.pi)
 
+_stats_mod = None
+def _get_stats():
+	"""Return module, scipy.stats, or None if unavailable.
+	The (slow) import is deferred until p-values are first needed.
+	"""
+	global _stats_mod
+	if _stats_mod is None:
+		_stats_mod = False
+		if have_scipy:
+			try:
+				from scipy import stats
+				_stats_mod = stats
+			except (ImportError, OSError):
+				logging.warn("Could not import scipy.stats.")
+	return _stats_mod or None
+
+def _getstate_slots(self):
+	"""Return dict, the values of the set slots.
+	(A class with `__slots__` has no `__dict__` for pickle to copy.)
+	"""
+	return dict((name, getattr(self, name)) for name in self.__slots__
+		if hasattr(self, name))
 
+def _setstate_slots(self, state):
+	"""Return None.  Restore slot values from `state`."""
+	for name, value in state.items():
+		setattr(self, name, value)
+
+
+class BatchOLSResult(namedtuple('BatchOLSResult',
+		'coefs se tvals resids ess sigma2 df_e indep_names')):
+	"""Results of `OLS.batch`, one column per regression:
+	`coefs`, `se`, and `tvals` are KxM, `resids` is TxM,
+	`ess` and `sigma2` have length M.
+	"""
+	__slots__ = ()
+
+def _make_design(nobs, indep, indep_names, constant, trend):
+	"""Return (X, names, ncoefs, nvars): the design matrix,
+	its column names, its number of columns, and the number
+	of columns from `indep` (i.e., excluding constant and trend).
+	"""
+	names = list(indep_names)
+	#deal with the case of no independent variables (except constant or trend)
+	if indep is not None:
+		indep = np.asarray(indep, dtype=np.float64)
+		if indep.ndim == 1:  #must have been a one dimensional indep
+			indep = indep[:,None]
+		names = names or list("x%02i"%(i+1) for i in range(indep.shape[1]))
+		assert ( nobs == len(indep) )
+		nvars = indep.shape[1]
+	else:
+		nvars = 0
+	if trend is True:             #default is center at midpoint
+		trend = nobs//2
+	has_trend = trend not in [None, False]  #allow trend centered at 0
+	#allocate the full array once and fill it by column
+	ncoefs = nvars + bool(constant) + has_trend
+	X = np.empty((nobs, ncoefs), dtype=np.float64, order='C')
+	col = nvars
+	if indep is not None:
+		X[:,:col] = indep
+	#construct constant if requested
+	if constant:  #not 0 or False
+		X[:,col].fill(constant)
+		names.append('constant')
+		col += 1
+	#construct trend if requested
+	if has_trend:
+		np.subtract(np.arange(nobs), trend, out=X[:,col])
+		names.append('trend')
+	return X, names, ncoefs, nvars
 
 class OLS(object):
 	"""Provides least squares estimates for a **single** equation,
@@ -88,6 +162,14 @@ class OLS(object):
 	:since: 2004-08-11
 	:author: Alan G. Isaac
 	"""
+	#no per-instance __dict__: cheaper construction (e.g., rolling regressions)
+	__slots__ = ('Y', 'X', 'dep_name', 'indep_names', 'nobs', 'nvars', 'ncoefs',
+		'xTx', 'xTy', '_chol', 'fitted', 'ess', '_resids', 'coefs',
+		'df_e', 'df_r', 'sigma2', 'llf', 'aic', 'bic', 'yvar', 'R2', 'R2adj', 'F',
+		'date', 'time', '_cov', '_standard_errors', '_tvals', '_pvals', '_pvalF',
+		'_rols_coefs')
+	__getstate__ = _getstate_slots
+	__setstate__ = _setstate_slots
 	def __init__(self, dep, indep=None, dep_name='', indep_names=(), constant=1, trend=None):
 		"""
 		:Parameters:
@@ -99,9 +181,7 @@ class OLS(object):
 		assert isinstance(dep_name,str), "Names must be strings."
 		if not have_numpy:
 			raise NotImplementedError('NumPy required for OLS.')
-		Y = np.asarray(dep)  #allow lists
-		if len(Y.shape) != 2:
-			Y = Y.reshape(-1,1)  #TODO single equation only
+		Y = np.ascontiguousarray(dep, dtype=np.float64).reshape(-1,1)  #allow lists; TODO single equation only
 		self.Y = Y
 		self.nobs = len(Y)
 		#make X sets self.nvars, self.nobs, self.indep_names
@@ -109,30 +189,56 @@ class OLS(object):
 		X = self.makeX(indep=indep, constant=constant, trend=trend)
 		assert isinstance(X, np.ndarray)
 		self.X = X  #used for end_points ... need for anything else?
-		coefs, ess = np.linalg.lstsq(X,Y)[:2]  #OLS estimates and ess
-		coefs = coefs.ravel()
-		try:
-			ess, = ess
-		except ValueError:
-			ess = np.nan
-			logging.warn('Rank problem with RHS variables. See help(numpy.linal.lstsq).')
-		self.ess = ess  #sum of squared residuals
 		assert (len(dep) == len(X)), "Number of observations do not agree."
 		self.dep_name = dep_name or 'y'
 		#data based attributes
-		self.xTx = np.dot(X.T , X)
-		self.xTy = np.dot(X.T , Y)
-		self.fitted = np.dot(X,coefs[:,None])
-		resids = np.ravel(Y - self.fitted)
-		if not np.isnan(ess):
-			assert abs(self.ess - np.dot(resids,resids))<0.001 #check error sum of squares TODO: delete
+		self.xTx = xTx = np.dot(X.T , X)
+		self.xTy = xTy = np.dot(X.T , Y)
+		#solve the normal equations by Cholesky; keep the factor for `cov`
+		#fall back to QR, then to lstsq, as X becomes ill-conditioned
+		eps = np.finfo(np.float64).eps
+		self._chol = None
+		coefs = None
+		if have_scipy:
+			try:
+				chol = cho_factor(xTx, lower=True)
+				#diagonal of the factor of the column-scaled xTx (S xTx S = (S L)(S L)')
+				d = np.abs(chol[0].diagonal()) / np.sqrt(xTx.diagonal())
+				if d.min() > eps**0.25 * d.max():  #else normal equations lose too much precision
+					self._chol = chol
+			except la.LinAlgError:
+				pass
+		if self._chol is not None:
+			coefs = cho_solve(self._chol, xTy)
+		elif have_scipy:  #QR (LAPACK dgels) still works if X is full rank but ill-conditioned
+			qr, x, info = dgels(X, Y)
+			r = np.abs(qr.diagonal())
+			if info == 0 and r.min() > eps * max(X.shape) * r.max():
+				coefs = x[:self.ncoefs]
+		if coefs is None:
+			coefs, _, rank = la.lstsq(X,Y)[:3]  #OLS estimates
+			if rank < X.shape[1]:
+				logging.warn('Rank problem with RHS variables. See help(numpy.linal.lstsq).')
+		#residuals and their sum of squares, written into one preallocated array
+		nobs = self.nobs
+		self.fitted = fitted = np.dot(X,coefs)
+		y = Y.ravel()
+		resids = np.empty(nobs)
+		np.subtract(y, fitted.ravel(), out=resids)
+		ess = float(np.dot(resids,resids))
+		self.ess = ess  #sum of squared residuals
 		self._resids = resids                          #resids is a property
+		#center before squaring: raw power sums cancel badly for large means
+		ydev = y - y.sum()/nobs
+		yvar = np.dot(ydev,ydev) / nobs
+		edev = resids - resids.sum()/nobs
+		evar = np.dot(edev,edev) / nobs
 		#end of matrix algebra
 		#make self.coefs a 1d array (note: coefs is 2d bc Y is 2d)
 		self.coefs = np.ravel(coefs)
 		self.df_e = self.nobs - self.ncoefs				# degrees of freedom, error 
 		self.sigma2 = self.ess / self.df_e              # sigma^2 = e'e/(T-K)
-		self.llf, self.aic, self.bic = self.llf()
+		self.llf, self.aic, self.bic = self.get_llf()
 		# convenience declarations: attributes to be computed as needed
 		self._cov = None                                #the parameter covariance matrix
 		self._standard_errors = None                    #the parameter standard errors
@@ -146,26 +252,63 @@ class OLS(object):
 		################
 		#stuff from Vince
 		################ 
-		self.yvar = Y.var()
-		self.R2 = 1 - self.resids.var()/self.yvar			# model R-squared
+		self.yvar = yvar
+		self.R2 = 1 - evar/yvar			# model R-squared
 		self.R2adj = 1-(1-self.R2)*((self.nobs-1)/(self.nobs-self.ncoefs))	# adjusted R-square 
 		self.df_r = self.ncoefs - 1						# degrees of freedom, regression 
 		self.F = (self.R2/self.df_r) / ((1-self.R2)/self.df_e)	# model F-statistic
 		self._pvalF = None
+	@classmethod
+	def batch(cls, dep, indep=None, indep_names=(), constant=1, trend=None):
+		"""Return BatchOLSResult, the least squares estimates
+		for M regressions that share the same RHS variables.
+
+		:Parameters:
+			`dep` : array
+				(T x M) array, one LHS variable per column
+			`indep` : array
+				(T x K) array, the RHS variables, in columns
+		:note: forms and inverts xTx only once for all M regressions
+		"""
+		if not have_numpy:
+			raise NotImplementedError('NumPy required for OLS.')
+		Y = np.asarray(dep, dtype=np.float64)
+		if Y.ndim == 1:
+			Y = Y[:,None]
+		#build the shared RHS variables once
+		nobs = len(Y)
+		X, names, ncoefs, _ = _make_design(nobs, indep, indep_names, constant, trend)
+		xTx_inv = la.inv(np.dot(X.T, X))
+		coefs = np.dot(xTx_inv, np.dot(X.T, Y))
+		resids = Y - np.dot(X, coefs)
+		ess = (resids*resids).sum(axis=0)
+		df_e = nobs - ncoefs
+		sigma2 = ess / df_e
+		se = np.sqrt(sigma2[None,:] * xTx_inv.diagonal()[:,None])
+		return BatchOLSResult(coefs, se, coefs/se, resids, ess, sigma2, df_e, names)
 	def get_cov(self):
 		"""get covariance matrix for solution; compute if nec"""
 		if self._cov is None:
-			try:
-				self._cov = self.sigma2 * la.inv(self.xTx)     #covariance matrix, as array
-			except np.linalg.linalg.LinAlgError:
-				self._cov = np.nan * np.empty_like(self.xTx)
-		#TODO var-cov(b),shd use invpd when availabe
+			if self._chol is not None:  #reuse the Cholesky factor of xTx
+				self._cov = self.sigma2 * cho_solve(self._chol, np.eye(self.ncoefs))
+			else:
+				try:
+					self._cov = self.sigma2 * la.inv(self.xTx)     #covariance matrix, as array
+				except la.LinAlgError:
+					self._cov = np.nan * np.empty_like(self.xTx)
 		return self._cov
 	cov = property(get_cov, None, None, "parameter covariance matrix")
 	def get_standard_errors(self):	# coef. standard errors
 		"""compute standard errors for solution"""
 		if self._standard_errors is None:
-			self._standard_errors = np.sqrt(self.cov.diagonal())
+			if self._cov is None and self._chol is not None:
+				#diagonal of inv(xTx) from one triangular solve: inv(xTx) = inv(L).T inv(L)
+				c, lower = self._chol
+				Linv = solve_triangular(c, np.eye(self.ncoefs), lower=lower)
+				inv_diag = (Linv*Linv).sum(axis=0)
+				self._standard_errors = np.sqrt(self.sigma2 * inv_diag)
+			else:
+				self._standard_errors = np.sqrt(self.cov.diagonal())
 		return self._standard_errors
 	se = property(get_standard_errors, None, None, "coefficient standard errors")
 	def get_tvals(self):
@@ -175,8 +318,9 @@ class OLS(object):
 	tvals = property(get_tvals, None, None, "t-ratios for parameters")
 	def get_pvals(self):
 		if self._pvals is None:
-			if have_scipy:
-				self._pvals = (1-Sstats.t.cdf(np.abs(self.tvals), self.df_e)) * 2	# coef. p-values
+			Sstats = _get_stats()
+			if Sstats is not None:
+				self._pvals = 2.0 * Sstats.t.sf(np.abs(self.tvals), self.df_e)	# coef. p-values
 			else:
 				logging.warn("SciPy unavailable. (Needed to compute p-values.)")
 				self._pvals = [np.inf for _ in range(self.ncoefs)]
@@ -184,8 +328,9 @@ class OLS(object):
 	pvals = property(get_pvals, None, None, "p-values for coef t-ratios, based on Student-t distribution")
 	def get_pvalF(self):
 		if self._pvalF is None:
-			if have_scipy:
-				self._pvalF = 1-Sstats.f.cdf(self.F, self.df_r, self.df_e)	# F-statistic p-value
+			Sstats = _get_stats()
+			if Sstats is not None:
+				self._pvalF = Sstats.f.sf(self.F, self.df_r, self.df_e)	# F-statistic p-value
 			else:
 				logging.warn("SciPy unavailable. (Needed to compute p-values.)")
 				self._pvalF = np.inf
@@ -197,58 +342,29 @@ class OLS(object):
 	def slope_intercept(self, xcol=0):
 		"""Return: slope and intercept for variations in one independent variable.
 		"""
-		X = self.X.A         #as array
-		x = X[:,xcol]
+		X = self.X
 		means = X.mean(axis=0)
 		means[xcol] = 0
 		intercept = np.dot(self.coefs, means)
 		slope = self.coefs[xcol]
 		return slope, intercept
-	def llf(self):
+	def get_llf(self):
 		"""Return model log-likelihood and two information criteria.
 
 		:author: Vincent Nijs & Alan Isaac
 		"""
 		# Model log-likelihood, AIC, and BIC criterion values 
 		nobs, ncoefs, ess = self.nobs, self.ncoefs, self.ess
-		llf = -(nobs*1/2)*(1+math.log(2*math.pi)) - (nobs/2)*math.log(ess/nobs)
-		aic = -2*llf/nobs + (2*ncoefs/nobs)
-		bic = -2*llf/nobs + (ncoefs*math.log(nobs))/nobs
+		llf = -0.5*nobs*(1.0 + _LOG_2PI + math.log(ess/nobs))
+		aic = (-2.0*llf + 2.0*ncoefs)/nobs
+		bic = (-2.0*llf + ncoefs*math.log(nobs))/nobs
 		return llf, aic, bic
 	def makeX(self, indep, constant, trend):
 		"""Return array, the independent variables,
 		which may add a constant and/or a trend.
 		"""
-		nobs = self.nobs
-		#deal with the case of no independent variables (except constant or trend)
-		X = list()  #list to hold all independent variables
-		if indep is not None:
-			indep = np.asarray(indep)
-			if len(indep.shape)==1:  #must have been a one dimensional indep
-				indep = np.atleast_2d(X).T
-			self.indep_names = self.indep_names or list("x%02i"%(i+1) for i in range(indep.shape[1]))
-			assert ( nobs == len(indep) )
-			self.nvars = indep.shape[1]
-			X.append(indep)
-		else:
-			self.nvars = 0
-		self.ncoefs = self.nvars
-		#construct constant if requested
-		if constant:  #not 0 or False
-			constant = constant * np.ones((nobs,1))
-			self.ncoefs += 1
-			self.indep_names.append('constant')
-			X.append(constant)
-		#construct trend if requested
-		if trend is True:             #default is center at midpoint
-			trend = nobs//2
-		if trend not in [None, False]:  #allow trend centered at 0
-			trend = np.atleast_2d(np.arange(nobs) - trend).T
-			self.ncoefs += 1
-			self.indep_names.append('trend')
-			X.append(trend)
-		X = np.hstack( X )
-		assert (self.nobs, self.ncoefs) == X.shape
+		X, self.indep_names, self.ncoefs, self.nvars = _make_design(
+			self.nobs, indep, self.indep_names, constant, trend)
 		return X
 	def print_results(self):
 		"""Return None.  Print results.
@@ -309,21 +425,21 @@ Skew     Kurtosis            % -5.6f' % tuple([skew, kurtosis])
 		if self._rols_coefs is not None:
 			return self._rols_coefs
 		from numpy.linalg import solve
-		Y, X = np.asmatrix(self.Y), np.asmatrix(self.X)
+		Y, X = self.Y, self.X
 		nobs, ncoefs = X.shape
-		X0 = X[:ncoefs]  #square matrix
-		Y0 = Y[:ncoefs]  #square matrix
+		X0 = X[:ncoefs]  #square array
+		Y0 = Y[:ncoefs]
 		#create array to hold parameter estimates
 		coef_array = np.empty( (nobs-ncoefs+1, ncoefs) )
-		coef_array[0] = solve(X0,Y0).A1
-		xTx = X0.T * X0
-		xTy = X0.T * Y0
+		coef_array[0] = solve(X0,Y0).ravel()
+		xTx = np.dot(X0.T, X0)
+		xTy = np.dot(X0.T, Y0)
 		#get initial parameter estimate (shortest possible data sample)
 		#iteratively update parameter estimates
 		for i in range(ncoefs,nobs):
-			xTx += X[i].T * X[i]
-			xTy += X[i].T * Y[i]
-			coef_array[i-ncoefs+1] = solve(xTx,xTy).A1
+			xTx += np.outer(X[i], X[i])
+			xTy += np.outer(X[i], Y[i])
+			coef_array[i-ncoefs+1] = solve(xTx,xTy).ravel()
 		if keep:
 			self._rols_coefs = coef_array
 		return coef_array
@@ -331,7 +447,7 @@ Skew     Kurtosis            % -5.6f' % tuple([skew, kurtosis])
 
 
 
-def linreg(X, Y):
+def linreg(X, Y, verbose=False):
 	"""Return (a,b),
 	coefficients from the linear regression for y = ax + b. ::
 
@@ -364,7 +480,7 @@ def linreg(X, Y):
 		 R^2 = 1 - {\sum_i (y_i - \hat{y_i})^2 \over \sum_i (y_i - \mean{y})^2}
 			 = 1 - residual/meanerror
 
-	It also prints a few other data, ::
+	If `verbose`, it also prints a few other data, ::
 	
 		 N, a, b, R^2, s^2,
 
@@ -372,37 +488,46 @@ def linreg(X, Y):
 
 	Only the coefficients of regression line are returned.
 	Other informations is sent to stdout to be read later.  
+	Uses NumPy when available.
 
 	:author: William Park
 	"""
-	from math import sqrt
-	if len(X) != len(Y):  raise ValueError, 'unequal length'
+	if len(X) != len(Y):  raise ValueError('unequal length')
 
 	N = len(X)
-	Sx = Sy = Sxx = Syy = Sxy = 0.0
-	for x, y in map(None, X, Y):
-		Sx = Sx + x
-		Sy = Sy + y
-		Sxx = Sxx + x*x
-		Syy = Syy + y*y
-		Sxy = Sxy + x*y
+	if have_numpy:
+		X = np.asarray(X, dtype=np.float64)
+		Y = np.asarray(Y, dtype=np.float64)
+		Sx, Sy = X.sum(), Y.sum()
+		Sxx, Sxy = np.dot(X,X), np.dot(X,Y)
+	else:
+		Sx, Sy = math.fsum(X), math.fsum(Y)
+		Sxx = math.fsum(x*x for x in X)
+		Sxy = math.fsum(x*y for x, y in zip(X, Y))
 	det = Sxx * N - Sx * Sx
 	a, b = (Sxy * N - Sy * Sx)/det, (Sxx * Sy - Sx * Sxy)/det
 
-	meanerror = residual = 0.0
-	for x, y in map(None, X, Y):
-		meanerror = meanerror + (y - Sy/N)**2
-		residual = residual + (y - a * x - b)**2
+	#center before squaring: Syy - Sy*Sy/N cancels badly for large means
+	ybar = Sy/N
+	if have_numpy:
+		dev = Y - ybar
+		meanerror = np.dot(dev, dev)
+		resid = Y - (a*X + b)
+		residual = np.dot(resid, resid)
+	else:
+		meanerror = math.fsum((y - ybar)**2 for y in Y)
+		residual = math.fsum((y - a * x - b)**2 for x, y in zip(X, Y))
 	RR = 1 - residual/meanerror
 	ss = residual / (N-2)
 	Var_a, Var_b = ss * N / det, ss * Sxx / det
 	 
-	print "y=ax+b"
-	print "N= %d" % N
-	print "a= %g \\pm t_{%d;\\alpha/2} %g" % (a, N-2, sqrt(Var_a))
-	print "b= %g \\pm t_{%d;\\alpha/2} %g" % (b, N-2, sqrt(Var_b))
-	print "R^2= %g" % RR
-	print "s^2= %g" % ss
+	if verbose:
+		print "y=ax+b"
+		print "N= %d" % N
+		print "a= %g \\pm t_{%d;\\alpha/2} %g" % (a, N-2, math.sqrt(Var_a))
+		print "b= %g \\pm t_{%d;\\alpha/2} %g" % (b, N-2, math.sqrt(Var_b))
+		print "R^2= %g" % RR
+		print "s^2= %g" % ss
 	 
 	return a, b
 
@@ -419,7 +544,25 @@ def linreg(X, Y):
 
 
 
-class OLSvn:
+def _compute_residual_stats(e):
+	"""Return (m2, skew, kurtosis, dw): the second central moment,
+	skewness, (non-excess) kurtosis, and Durbin-Watson statistic
+	of residuals `e`, from one set of power sums.
+	"""
+	e = np.asarray(e, dtype=np.float64).ravel()
+	n = len(e)
+	#center once: raw power sums cancel badly if the mean is not ~0
+	d = e - e.sum()/n
+	d2 = d*d
+	s2 = d2.sum()
+	m2 = s2/n
+	m3 = np.dot(d, d2)/n
+	m4 = np.dot(d2, d2)/n
+	#sum of squared first differences, without forming diff(e)
+	ssd = 2*s2 - d2[0] - d2[-1] - 2*np.dot(d[1:], d[:-1])
+	return m2, m3/m2**1.5, m4/(m2*m2), ssd/np.dot(e, e)
+
+class OLSvn(object):
 	"""
 	Author: Vincent Nijs (+ ?)
 
@@ -457,13 +600,18 @@ class OLSvn:
 				>>> print m.p
 	
 	"""
+	__slots__ = ('y', 'x', 'y_varnm', 'x_varnm', 'nobs', 'ncoef', 'df_e', 'df_r',
+		'_L', '_inv_xx', 'b', 'e', '_residual_stats', 'sse', 'se', 't', 'p',
+		'R2', 'R2adj', 'F', 'Fpv')
+	__getstate__ = _getstate_slots
+	__setstate__ = _setstate_slots
 
 	def __init__(self,y,x,y_varnm = 'y',x_varnm = ''):
 		"""
 		Initializing the ols class. 
 		"""
 		self.y = y
-		self.x = c_[ones(x.shape[0]),x]
+		self.x = np.c_[np.ones(x.shape[0]),x]
 		self.y_varnm = y_varnm
 		if not isinstance(x_varnm,list): 
 			self.x_varnm = ['const'] + list(x_varnm)
@@ -475,56 +623,72 @@ class OLSvn:
 
 	def estimate(self):
 
-		# estimating coefficients, and basic stats
-		self.inv_xx = inv(dot(self.x.T,self.x))
-		xy = dot(self.x.T,self.y)
-		self.b = dot(self.inv_xx,xy)					# estimate coefficients
-
 		self.nobs = self.y.shape[0]						# number of observations
 		self.ncoef = self.x.shape[1]					# number of coef.
+
+		# estimating coefficients, and basic stats
+		xx = np.dot(self.x.T,self.x)
+		xy = np.dot(self.x.T,self.y)
+		self._L = L = cholesky(xx, lower=True)			# xx = L L'
+		self._inv_xx = None								# computed only on request
+		self.b = cho_solve((L, True), xy)				# estimate coefficients
 		self.df_e = self.nobs - self.ncoef				# degrees of freedom, error 
 		#TODO: fix!
 		self.df_r = self.ncoef - 1						# degrees of freedom, regression 
 
-		self.e = self.y - dot(self.x,self.b)			# residuals
-		self.sse = dot(self.e,self.e)/self.df_e			# SSE
-		self.se = sqrt(diagonal(self.sse*self.inv_xx))	# coef. standard errors
+		self.e = self.y - np.dot(self.x,self.b)			# residuals
+		self._residual_stats = None
+		self.sse = np.dot(self.e,self.e)/self.df_e		# SSE
+		Linv = solve_triangular(L, np.eye(self.ncoef), lower=True)
+		self.se = np.sqrt(self.sse*(Linv*Linv).sum(axis=0))	# coef. standard errors, diag(inv(xx)) = colsums of inv(L)**2
+		Sstats = _get_stats()
 		self.t = self.b / self.se						# coef. t-statistics
-		self.p = (1-Sstats.t.cdf(abs(self.t), self.df_e)) * 2	# coef. p-values
+		self.p = 2.0 * Sstats.t.sf(abs(self.t), self.df_e)	# coef. p-values
 
 		self.R2 = 1 - self.e.var()/self.y.var()			# model R-squared
 		self.R2adj = 1-(1-self.R2)*((self.nobs-1)/(self.nobs-self.ncoef))	# adjusted R-square
 
 		self.F = (self.R2/self.df_r) / ((1-self.R2)/self.df_e)	# model F-statistic
-		self.Fpv = 1-Sstats.f.cdf(self.F, self.df_r, self.df_e)	# F-statistic p-value
+		self.Fpv = Sstats.f.sf(self.F, self.df_r, self.df_e)	# F-statistic p-value
+
+	def get_inv_xx(self):
+		if self._inv_xx is None:
+			self._inv_xx = cho_solve((self._L, True), np.eye(self.ncoef))
+		return self._inv_xx
+	inv_xx = property(get_inv_xx, None, None, "inverse of x'x")
 
 	def dw(self):
 		"""
 		Calculates the Durbin-Waston statistic
 		"""
-		de = diff(self.e,1)
-		dw = dot(de,de) / dot(self.e,self.e);
+		return self.residual_stats()[3]
 
-		return dw
+	def residual_stats(self):
+		"""
+		Return (m2, skew, kurtosis, dw) for the residuals, computed once
+		"""
+		if self._residual_stats is None:
+			self._residual_stats = _compute_residual_stats(self.e)
+		return self._residual_stats
 
 	def omni(self):
 		"""
 		Omnibus test for normality
 		"""
-		return Sstats.normaltest(self.e) 
+		return _get_stats().normaltest(self.e) 
 	
 	def JB(self):
 		"""
 		Calculate residual skewness, kurtosis, and do the JB test for normality
 		"""
 
+		Sstats = _get_stats()
 		# Calculate residual skewness and kurtosis
-		skew = Sstats.skew(self.e) 
-		kurtosis = 3 + Sstats.kurtosis(self.e) 
+		skew, kurtosis = self.residual_stats()[1:3]
 		
 		# Calculate the Jarque-Bera test for normality
-		JB = (self.nobs/6) * (square(skew) + (1/4)*square(kurtosis-3))
-		JBpv = 1-Sstats.chi2.cdf(JB,2);
+		JB = (self.nobs/6) * (skew**2 + (1/4)*(kurtosis-3)**2)
+		JBpv = Sstats.chi2.sf(JB,2);
 
 		return JB, JBpv, kurtosis, skew
 
@@ -534,9 +698,10 @@ class OLSvn:
 		"""
 		
 		# Model log-likelihood, AIC, and BIC criterion values 
-		ll = -(self.nobs*1/2)*(1+np.log(2*math.pi)) - (self.nobs/2)*np.log(np.dot(self.e,self.e)/self.nobs)
-		aic = -2*ll/self.nobs + (2*self.ncoef/self.nobs)
-		bic = -2*ll/self.nobs + (self.ncoef*np.log(self.nobs))/self.nobs
+		nobs, ncoef = self.nobs, self.ncoef
+		ll = -0.5*nobs*(1.0 + _LOG_2PI + math.log(float(np.dot(self.e,self.e))/nobs))
+		aic = (-2.0*ll + 2.0*ncoef)/nobs
+		bic = (-2.0*ll + ncoef*math.log(nobs))/nobs
 
 		return ll, aic, bic
 	
@@ -550,7 +715,7 @@ class OLSvn:
 
 		# extra stats
 		ll, aic, bic = self.ll()
-		JB, JBpv, skew, kurtosis = self.JB()
+		JB, JBpv, kurtosis, skew = self.JB()
 		omni, omnipv = self.omni()
 
 		# printing output to screen
@@ -161,6 +161,37 @@ class test_iter(unittest.TestCase):
 		self.assert_(fmath.feq(result1, x4zero, 1e-8))
 		self.assert_(fmath.feq(result2, x4zero, 1e-8))
 		self.assert_(fmath.feq(result3, x4zero, 1e-7))
+	@unittest.skipUnless(iterate.have_numba, 'requires numba')
+	def test_bisect_jit(self):
+		import numba
+		f = lambda x: x**3 - 2.0
+		f_nb = numba.njit(f)
+		result1 = iterate.bisect(f, 0.0, 2.0, eps=1e-10)
+		result2 = iterate.bisect(f_nb, 0.0, 2.0, eps=1e-10, jit=True)
+		self.assert_(fmath.feq(result1, result2, 1e-12))
+		b1 = iterate.Bisect(f_nb, 0.0, 2.0, iterate.AbsDiff(1e-9), jit=True)
+		b1.run()
+		self.assert_(fmath.feq(b1.value, result1, 1e-8))
+	def test_bisect_jit_fallback(self):
+		#without numba, jit=True silently uses the pure Python code
+		have_numba = iterate.have_numba
+		iterate.have_numba = False
+		try:
+			f = lambda x: x**3 - 2.0
+			result1 = iterate.bisect(f, 0.0, 2.0, eps=1e-10)
+			result2 = iterate.bisect(f, 0.0, 2.0, eps=1e-10, jit=True)
+			b1 = iterate.Bisect(f, 0.0, 2.0, iterate.AbsDiff(1e-9), jit=True)
+			b1.run()
+		finally:
+			iterate.have_numba = have_numba
+		self.assertEqual(result1, result2)
+		self.assert_(fmath.feq(b1.value, result1, 1e-8))
+	def test_bisect_batch(self):
+		import numpy as np
+		x4zero = np.random.randint(0, 20, size=10)
+		f = lambda x: (x-x4zero)**3
+		result = iterate.bisect_batch(f, x4zero - 1.0, x4zero + 2.0, eps=1e-9)
+		self.assert_(np.allclose(result, x4zero, atol=1e-8))
 	def test_falsi(self):
 		x4zero = random.randrange(20)
 		f = lambda x: (x-x4zero)**3
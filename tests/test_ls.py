@@ -13,13 +13,14 @@ __author__ = 'Alan G. Isaac (and others as specified)'
 
 from itertools import izip
 import random
+import pickle
 import numpy as np
 import numpy.linalg as la
 import unittest
 
 from tests_config import econpy  #tests_config.py modifies sys.path to find econpy
 from econpy.pytrix.pytrix import Vector, Vplus, dot, norm 
-from econpy.pytrix.ls import rolsf, OLS
+from econpy.pytrix.ls import rolsf, OLS, OLSvn, _compute_residual_stats
 
 
 class testPytrix(unittest.TestCase):
@@ -33,6 +34,64 @@ class testPytrix(unittest.TestCase):
 		b1hat, b0hat = model.coefs #constant comes last
 		self.assert_(abs(b1hat-b1)<0.1)
 		self.assert_(abs(b0hat-b0)<0.1)
+	def test_ols_large_mean(self):
+		#R2 must not be distorted by a large mean of y
+		x = np.random.random((500,2))
+		y0 = np.dot(x, [1.0, 2.0]) + np.random.normal(size=500)
+		m0 = OLS(dep=y0, indep=x)
+		m1 = OLS(dep=y0 + 1e9, indep=x)
+		self.assert_(abs(m1.R2 - m0.R2) < 1e-4)
+		self.assert_(abs(m1.yvar/m0.yvar - 1) < 1e-4)
+		self.assert_(abs(m1.F/m0.F - 1) < 1e-3)
+	def test_ols_collinear(self):
+		#near-collinear X must not be solved by the normal equations
+		rs = np.random.RandomState(1)
+		x1 = rs.random_sample(2000)
+		x = np.column_stack([x1, x1 + rs.random_sample(2000)*1e-6])
+		y = np.dot(x, [1.0, 2.0]) + rs.normal(size=2000)*0.1
+		model = OLS(dep=y, indep=x)
+		X = np.column_stack([x, np.ones(2000)])
+		ref = la.lstsq(X, y)[0]
+		self.assert_(np.abs(model.coefs - ref).max() < 1e-8 * np.abs(ref).max())
+	def test_residual_stats_shift(self):
+		#moments must not depend on the mean of the residuals
+		e = np.random.standard_exponential(500) - 1
+		m2, skew, kurt, dw = _compute_residual_stats(e)
+		m2s, skews, kurts, dws = _compute_residual_stats(e + 1e6)
+		self.assert_(abs(m2s/m2 - 1) < 1e-6)
+		self.assert_(abs(skews - skew) < 1e-6)
+		self.assert_(abs(kurts - kurt) < 1e-6)
+		self.assert_(np.allclose(m2, e.var()))
+	def test_pickle(self):
+		x = np.random.random((100,2))
+		y = np.dot(x, [1.0, 2.0]) + np.random.random(100)
+		model = OLS(dep=y, indep=x)
+		model.se  #set some lazily computed attributes
+		for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+			model2 = pickle.loads(pickle.dumps(model, protocol))
+			self.assert_(np.allclose(model2.coefs, model.coefs))
+			self.assert_(np.allclose(model2.se, model.se))
+			self.assert_(np.allclose(model2.cov, model.cov))
+			self.assertEqual(model2.R2, model.R2)
+			self.assertEqual(model2.indep_names, model.indep_names)
+		model = OLSvn(y, x)
+		model.dw()  #cache the residual statistics
+		for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+			model2 = pickle.loads(pickle.dumps(model, protocol))
+			self.assert_(np.allclose(model2.b, model.b))
+			self.assert_(np.allclose(model2.inv_xx, model.inv_xx))
+			self.assertEqual(model2.dw(), model.dw())
+	def test_ols_batch(self):
+		x = np.random.random((100,2))
+		y = np.random.random((100,3))
+		result = OLS.batch(y, x)
+		for j in range(3):
+			model = OLS(dep=y[:,j], indep=x)
+			self.assert_(np.allclose(result.coefs[:,j], model.coefs))
+			self.assert_(np.allclose(result.se[:,j], model.se))
+			self.assert_(np.allclose(result.resids[:,j], model.resids))
+			self.assert_(np.allclose(result.sigma2[j], model.sigma2))
+		self.assertEqual(result.indep_names, ['x01', 'x02', 'constant'])
 
 # +++++++++++++++++++++++++++++++++++++++++++
 #                rolsftest.py
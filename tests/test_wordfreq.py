@@ -0,0 +1,72 @@
+'''
+Unit tests for wordfreq.py.
+'''
+from __future__ import absolute_import
+
+__docformat__ = "restructuredtext en"
+
+import os
+import tempfile
+import unittest
+
+from tests_config import econpy  #tests_config.py modifies sys.path to find econpy
+from econpy.utilities.wordfreq import WordFreq
+
+
+class testWordFreq(unittest.TestCase):
+	def setUp(self):
+		fd, self.filename = tempfile.mkstemp(suffix='.txt')
+		os.close(fd)
+	def tearDown(self):
+		os.remove(self.filename)
+	def write(self, text):
+		with open(self.filename, 'wb') as fh:
+			fh.write(text)
+	def occurrence_order(self, wf):
+		occur = wf.summarize().split('OCCURRENCE ORDER')[1]
+		return [line.split() for line in occur.splitlines() if line.strip(' \t=')]
+	def test_top_n(self):
+		self.write(b'dog cat bird cat dog ant cat eel')
+		wf = WordFreq(self.filename)
+		#ties (dog, and the singletons) stay in alpha order
+		self.assertEqual(self.occurrence_order(wf),
+			[['cat','3'], ['dog','2'], ['ant','1'], ['bird','1'], ['eel','1']])
+		wf.top_n = 3
+		self.assertEqual(self.occurrence_order(wf),
+			[['cat','3'], ['dog','2'], ['ant','1']])
+	def test_lazy(self):
+		#nothing is read until the counts are used
+		wf = WordFreq(self.filename + '.missing')
+		self.assertRaises(IOError, getattr, wf, 'ct_words')
+		self.write(b'one two three')
+		wf = WordFreq(self.filename)
+		self.assertEqual(wf._word_hash, None)
+		self.assertEqual(wf.ct_words, 3)
+		self.assertRaises(AttributeError, setattr, wf, 'ct_words', 0)
+	def test_start_after(self):
+		self.write(b'skip these words\n.. begin\ncount these words\n')
+		wf = WordFreq(self.filename)
+		wf.start_after = '.. begin'
+		self.assertEqual(sorted(wf.word_hash), ['count', 'these', 'words'])
+		#if the marker is missing, nothing is counted
+		wf = WordFreq(self.filename)
+		wf.start_after = '.. nowhere'
+		self.assertEqual(wf.word_hash, {})
+		self.assertEqual(wf.ct_words, 0)
+	def test_empty_file(self):
+		self.write(b'')
+		wf = WordFreq(self.filename)
+		self.assertEqual(wf.word_hash, {})
+		self.assertEqual((wf.ct_words, wf.ct_longwords), (0, 0))
+	def test_release(self):
+		self.write(b'an apple a day')
+		wf = WordFreq(self.filename)
+		self.assertEqual((wf.ct_words, wf.ct_longwords), (4, 2))
+		wf.release()
+		self.assertEqual(wf._word_hash, None)
+		self.write(b'an apple and a pear')
+		self.assertEqual((wf.ct_words, wf.ct_longwords), (5, 3))
+		self.assertEqual(sorted(wf.word_hash), ['and', 'apple', 'pear'])
+
+if __name__=="__main__":
+	unittest.main()
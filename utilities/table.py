@@ -84,12 +84,11 @@ Potential problems for Python 3
 """
 from __future__ import division, with_statement
 import logging
-try: #plan for Python 3
+try: #Python 2
 	from itertools import izip_longest, izip as zip
-	pass   # accommodate 2to3 tool
-except ImportError:
-	pass
-from itertools import cycle
+except ImportError: #Python 3
+	from itertools import zip_longest as izip_longest
+from itertools import cycle, islice
 from collections import defaultdict
 import csv
 
@@ -192,27 +191,14 @@ class SimpleTable(list):
 		#self._raw_data = data
 		self.title = title
 		self._datatypes = datatypes or range(len(data[0]))
-		#start with default formatting
-		self._txt_fmt = default_txt_fmt.copy()
-		self._latex_fmt = default_latex_fmt.copy()
-		self._csv_fmt = default_csv_fmt.copy()
-		self._html_fmt = default_html_fmt.copy()
-		#substitute any general user specified formatting
-		#:note: these will be overridden by output specific arguments
-		self._csv_fmt.update(fmt_dict)
-		self._txt_fmt.update(fmt_dict)
-		self._latex_fmt.update(fmt_dict)
-		self._html_fmt.update(fmt_dict)
-		#substitute any output-type specific formatting
-		self._csv_fmt.update(csv_fmt or dict())
-		self._txt_fmt.update(txt_fmt or dict())
-		self._latex_fmt.update(ltx_fmt or dict())
-		self._html_fmt.update(html_fmt or dict())
-		self.output_formats = dict(
-			txt=self._txt_fmt,
-			csv=self._csv_fmt,
-			html=self._html_fmt,
-			latex=self._latex_fmt
+		#formatting for each output type is built on first use:
+		#defaults, then general user specified formatting,
+		#then any output-type specific formatting
+		self.output_formats = _OutputFormats(fmt_dict,
+			txt=txt_fmt,
+			csv=csv_fmt,
+			html=html_fmt,
+			latex=ltx_fmt
 			)
 		self._Cell = celltype or Cell
 		self._Row = rowtype or Row
@@ -288,14 +274,13 @@ class SimpleTable(list):
 		_Cell = self._Cell
 		_Row = self._Row
 		rows = []
+		dtypes = []  #per-column datatypes, cycled once rather than per cell
 		for datarow in raw_data:
-			dtypes = cycle(self._datatypes)
 			newrow = _Row(datarow, datatype='data', table=self, celltype=_Cell)
-			for cell in newrow:
-				try:
-					cell.datatype = next(dtypes)
-				except AttributeError: #Python 2.5 or earlier
-					cell.datatype = dtypes.next()
+			if len(dtypes) < len(newrow):
+				dtypes = list(islice(cycle(self._datatypes), len(newrow)))
+			for cell, dtype in zip(newrow, dtypes):
+				cell.datatype = dtype
 				cell.row = newrow  #a cell knows its row
 			rows.append(newrow)
 		logging.debug('Exit SimpleTable.data2rows.')
@@ -307,9 +292,9 @@ class SimpleTable(list):
 		output_format = get_output_format(output_format)
 		fmt = self.output_formats[output_format].copy()
 		fmt.update(fmt_dict)
-		ncols = max(len(row) for row in self)
+		ncols = max(map(len, self))
 		request = fmt.get('colwidths')
-		if request is 0: #assume no extra space desired (e.g, CSV)
+		if request == 0: #assume no extra space desired (e.g, CSV)
 			return [0] * ncols
 		elif request is None: #assume no extra space desired (e.g, CSV)
 			request = [0] * ncols
@@ -317,12 +302,14 @@ class SimpleTable(list):
 			request = [request] * ncols
 		elif len(request) < ncols:
 			request = [request[i%len(request)] for i in range(ncols)]
-		min_widths = []
-		for col in zip(*self):
-			maxwidth = max(len(c.format(0,output_format,**fmt)) for c in col)
-			min_widths.append(maxwidth)
-		result = map(max, min_widths, request)
-		return result
+		#one pass over the rows, keeping a running maximum per column
+		widths = list(request[:ncols])
+		for row in self:
+			for k, cell in enumerate(row):
+				w = len(cell.format(0, output_format, **fmt))
+				if w > widths[k]:
+					widths[k] = w
+		return widths
 	def _get_fmt(self, output_format, **fmt_dict):
 		"""Return dict, the formatting options.
 		"""
@@ -345,25 +332,46 @@ class SimpleTable(list):
 		"""Return string, the table as text."""
 		#fetch the text format, override with fmt_dict
 		fmt = self._get_fmt('txt', **fmt_dict)
-		#get rows formatted as strings
-		formatted_rows = [ row.as_string('text', **fmt) for row in self ]
+		#get rows formatted as strings (column widths computed once)
+		widths = self.get_colwidths('txt', **fmt)
+		#build each row decoration once, in whole repeats and at least
+		#as long as a row, so a decorated row just slices it to length
+		barlen = sum(widths) + len(fmt['colsep']) * (len(widths) - 1)
+		barlen += len(fmt.get('row_pre','')) + len(fmt.get('row_post',''))
+		row_fmt = fmt.copy()
+		for dec_key in ('header_dec_below', 'row_dec_below'):
+			dec = fmt.get(dec_key)
+			if dec and barlen > 0:
+				row_fmt[dec_key] = dec * -(-barlen // len(dec))
+		#rows with their own formatting compute their own widths
+		formatted_rows = [ row.as_string('text',
+			widths=None if row._has_own_fmt('txt') else widths, **row_fmt)
+			for row in self ]
 		rowlen = len(formatted_rows[-1]) #don't use header row
 
-		#place decoration above the table body, if desired
-		table_dec_above = fmt.get('table_dec_above','=')
-		if table_dec_above:
-			formatted_rows.insert(0, table_dec_above * rowlen)
-		#next place a title at the very top, if desired
+		#collect the output lines in order and join once
+		out = []
+		#place a title at the very top, if desired
 		#:note: user can include a newlines at end of title if desired
 		title = self.title
 		if title:
-			title = pad(self.title, rowlen, fmt.get('title_align','c'))
-			formatted_rows.insert(0, title)
-		#add decoration below the table, if desired
+			out.append(pad(title, rowlen, fmt.get('title_align','c')))
+		#build each decoration string once
+		table_dec_above = fmt.get('table_dec_above','=')
 		table_dec_below = fmt.get('table_dec_below','-')
-		if table_dec_below:
-			formatted_rows.append(table_dec_below * rowlen)
-		return '\n'.join(formatted_rows)
+		dec_above = table_dec_above * rowlen if table_dec_above else ''
+		if table_dec_below == table_dec_above:
+			dec_below = dec_above
+		else:
+			dec_below = table_dec_below * rowlen if table_dec_below else ''
+		#place decoration above the table body, if desired
+		if dec_above:
+			out.append(dec_above)
+		out.extend(formatted_rows)
+		#add decoration below the table, if desired
+		if dec_below:
+			out.append(dec_below)
+		return '\n'.join(out)
 	def as_html(self, **fmt_dict):
 		"""Return string.
 		This is the default formatter for HTML tables.
@@ -376,7 +384,10 @@ class SimpleTable(list):
 		if self.title:
 			title = '<caption>%s</caption>' % self.title
 			formatted_rows.append(title)
-		formatted_rows.extend( row.as_string('html', **fmt) for row in self )
+		widths = self.get_colwidths('html', **fmt)
+		formatted_rows.extend([ row.as_string('html',
+			widths=None if row._has_own_fmt('html') else widths, **fmt)
+			for row in self ])
 		formatted_rows.append('</table>')
 		return '\n'.join(formatted_rows)
 	def as_latex_tabular(self, **fmt_dict):
@@ -391,8 +402,10 @@ class SimpleTable(list):
 		if table_dec_above:
 			formatted_rows.append(table_dec_above)
 
-		formatted_rows.extend(
-			row.as_string(output_format='latex', **fmt) for row in self )
+		widths = self.get_colwidths('latex', **fmt)
+		formatted_rows.extend([ row.as_string('latex',
+			widths=None if row._has_own_fmt('latex') else widths, **fmt)
+			for row in self ])
 
 		table_dec_below = fmt['table_dec_below']
 		if table_dec_below:
@@ -441,6 +454,22 @@ class SimpleTable(list):
 		return [row.data for row in self]
 #END: class SimpleTable
 
+class _OutputFormats(dict):
+	"""Provides a dict of formatting options by output format.
+	The options for an output format are only built
+	when that format is first requested.
+	"""
+	def __init__(self, fmt_dict, **special_fmts):
+		dict.__init__(self)
+		self._fmt = fmt_dict
+		self._special_fmts = dict( (k, dict(v or ())) for k,v in special_fmts.items() )
+	def __missing__(self, output_format):
+		fmt = default_fmts[output_format].copy()  #KeyError for unknown format
+		fmt.update(self._fmt)
+		fmt.update(self._special_fmts.get(output_format, ()))
+		self[output_format] = fmt
+		return fmt
+
 def pad(s, width, align):
 	"""Return string padded with spaces,
 	based on alignment parameter."""
@@ -481,7 +510,7 @@ class Row(list):
 		self._fmt = fmt_dict
 		self.special_fmts = dict() #special formatting for any output format
 		self.dec_below = dec_below
-		list.__init__(self, (celltype(cell,row=self) for cell in seq))
+		list.__init__(self, [celltype(cell,row=self) for cell in seq])
 	def add_format(self, output_format, **fmt_dict):
 		"""
 		Return None. Adds row-instance specific formatting
@@ -492,6 +521,11 @@ class Row(list):
 		if output_format not in self.special_fmts:
 			self.special_fmts[output_format] = dict()
 		self.special_fmts[output_format].update(fmt_dict)
+	def _has_own_fmt(self, output_format):
+		"""Return bool, True if this row has formatting of its own
+		for `output_format` (so it cannot share the table's column widths).
+		"""
+		return bool(self._fmt) or output_format in self.special_fmts
 	def insert_stub(self, loc, stub):
 		"""Return None.  Inserts a stub cell
 		in the row at `loc`.
@@ -526,22 +560,36 @@ class Row(list):
 		"""Return string, sequence of column alignments.
 		Ensure comformable data_aligns in `fmt_dict`."""
 		fmt = self._get_fmt(output_format, **fmt_dict)
-		return ''.join( cell.alignment(output_format, **fmt) for cell in self )
-	def as_string(self, output_format='txt', **fmt_dict):
+		#`fmt` already overrides all table and row formatting,
+		#so a plain cell can use it directly instead of re-resolving it
+		_alignment = Cell.alignment
+		aligns = []
+		for cell in self:
+			if type(cell).alignment == _alignment and not cell._fmt:
+				aligns.append(cell._alignment(fmt))
+			else:
+				aligns.append(cell.alignment(output_format, **fmt))
+		return ''.join(aligns)
+	def as_string(self, output_format='txt', widths=None, **fmt_dict):
 		"""Return string: the formatted row.
 		This is the default formatter for rows.
 		Override this to get different formatting.
 		A row formatter must accept as arguments
 		a row (self) and an output format,
 		one of ('html', 'txt', 'csv', 'latex').
+		A table that formats many rows should compute its
+		column widths once and pass them as `widths`.
 		"""
 		fmt = self._get_fmt(output_format, **fmt_dict)
 
 		#get column widths
-		try:
-			colwidths = self.table.get_colwidths(output_format, **fmt)
-		except AttributeError:
-			colwidths = fmt.get('colwidths')
+		if widths is not None:
+			colwidths = widths
+		else:
+			try:
+				colwidths = self.table.get_colwidths(output_format, **fmt)
+			except AttributeError:
+				colwidths = fmt.get('colwidths')
 		if colwidths is None:
 			colwidths = (0,) * len(self)
 
@@ -552,7 +600,9 @@ class Row(list):
 		for cell, width in zip(self, colwidths):
 			content = cell.format(width, output_format=output_format, **fmt)
 			formatted_cells.append(content)
-		formatted_row = row_pre + colsep.join(formatted_cells) + row_post
+		formatted_row = colsep.join(formatted_cells)
+		if row_pre or row_post: #e.g., latex rows end with a line break
+			formatted_row = ''.join((row_pre, formatted_row, row_post))
 		formatted_row = self._decorate_below(formatted_row, output_format, **fmt)
 		return formatted_row
 	def _decorate_below(self, row_as_string, output_format, **fmt_dict):
@@ -566,9 +616,9 @@ class Row(list):
 				row0len = len(row_as_string)
 				dec_len = len (dec_below)
 				repeat, addon = divmod(row0len, dec_len)
-				result = row_as_string + "\n" + (dec_below * repeat + dec_below[:addon])
+				result = "\n".join((row_as_string, dec_below * repeat + dec_below[:addon]))
 			elif output_format == 'latex':
-				result = row_as_string + "\n" + dec_below
+				result = "\n".join((row_as_string, dec_below))
 			else:
 				raise ValueError("I can't decorate a %s header."%output_format)
 		return result
@@ -620,6 +670,9 @@ class Cell(object):
 		return fmt
 	def alignment(self, output_format, **fmt_dict):
 		fmt = self._get_fmt(output_format, **fmt_dict)
+		return self._alignment(fmt)
+	def _alignment(self, fmt):
+		"""Return string, the alignment for already resolved `fmt`."""
 		datatype = self.datatype
 		data_aligns = fmt.get('data_aligns','c')
 		if isinstance(datatype, int):
@@ -666,7 +719,7 @@ class Cell(object):
 				content = dfmt   #chk
 		else:
 			raise ValueError('Unknown cell datatype: %s'%datatype)
-		align = self.alignment(output_format, **fmt)
+		align = self._alignment(fmt)  #fmt is already resolved
 		return pad(content, width, align)
 	def get_datatype(self):
 		if self._datatype == None:
@@ -53,6 +53,11 @@ tbl = SimpleTable(table1data, test1header, test1stubs,
 	txt_fmt=txt_fmt1, ltx_fmt=ltx_fmt1, html_fmt=html_fmt1)
 
 
+class UpperRow(Row):
+	"""A custom row formatter with the documented signature."""
+	def as_string(self, output_format='txt', **fmt_dict):
+		return Row.as_string(self, output_format, **fmt_dict).upper()
+
 def custom_labeller(cell):
 	if cell.data is np.nan:
 		return 'missing'
@@ -137,6 +142,29 @@ class test_SimpleTable(unittest.TestCase):
 			print(actual)
 			print(desired)
 			self.assertEqual(actual, desired)
+	def test_custom_rowtype(self):
+		"""A Row subclass can override as_string"""
+		tbl2 = SimpleTable(table1data, test1header, test1stubs,
+			txt_fmt=txt_fmt1, ltx_fmt=ltx_fmt1, html_fmt=html_fmt1,
+			rowtype=UpperRow)
+		self.assertEqual(tbl2.as_text(), tbl.as_text().upper())
+		#only the rows (not the table tags) are upper case
+		rows = tbl.as_html().split('\n')[1:-1]
+		self.assertEqual(tbl2.as_html().split('\n')[1:-1], [row.upper() for row in rows])
+	def test_row_add_format(self):
+		"""Row specific formatting overrides the table column widths"""
+		tbl2 = SimpleTable([[1.2345,22],[3,4]], ['a','b'], ['s1','s2'])
+		tbl2[2].add_format('txt', colwidths=12)
+		desired = """
+======================================
+     a    b 
+------------
+s1 1.2345 22
+s2                3            4      
+--------------------------------------
+"""
+		actual = '\n%s\n' % tbl2.as_text()
+		self.assertEqual(actual, desired)
 	def test_csv01(self):
 		mydata = [[11,12],[21,22]]
 		myheaders = [ "Column 1", "Column 2" ]
@@ -5,55 +5,113 @@ Sample use:
 
 	wordfreq.py filename
 
-TODO: use collections.Counter (Python 3+)
+Words are maximal runs of ASCII letters.
 """
 
 from __future__ import division, with_statement
-import sys, string
-from itertools import cycle, ifilter, izip
-from collections import defaultdict
+import sys, os, re, heapq, mmap
+from collections import Counter
+from operator import itemgetter
 
-class WordFreq:
+if bytes is str:  #Python 2
+	_as_str = str
+else:
+	def _as_str(word):
+		return word.decode('ascii')
+
+#a word is a maximal run of ASCII letters; compiled once for all instances
+_WORD_RE = re.compile(br'[A-Za-z]+')
+#bytes tokenized per findall call, bounding the list of tokens held at once
+_CHUNK_SIZE = 1 << 20
+
+class WordFreq(object):
 	"""Summarize text file word counts.
+	The file is read and counted on first use of the counts
+	(e.g., by `summarize`), not at construction.
 	"""
 	def __init__(self, filename, **kw):
 		self.filename = filename
 		self.params = kw
-		self.word_hash = None
-		self.ct_words = 0
-		self.ct_longwords = 0
+		self._word_hash = None
+		self._ct_words = 0
+		self._ct_longwords = 0
 		#might want, e.g., start_after = ".. begin wordcount",
 		self.start_after = ''
 		self.wordsize_min = 3
 		self.freq_min = 1
-		self.describe()
+		#if set, list only the `top_n` most frequent words in occurrence order
+		self.top_n = None
+	@property
+	def word_hash(self):
+		if self._word_hash is None:
+			self.describe()
+		return self._word_hash
+	@property
+	def ct_words(self):
+		if self._word_hash is None:
+			self.describe()
+		return self._ct_words
+	@property
+	def ct_longwords(self):
+		if self._word_hash is None:
+			self.describe()
+		return self._ct_longwords
+	def release(self):
+		"""Return None.  Drop the word counts;
+		they are recomputed on next use.
+		"""
+		self._word_hash = None
+		self._ct_words = 0
+		self._ct_longwords = 0
 	def describe(self):
 		"""
 		Return None.
 		"""
 		start_after = self.start_after
 		wordsize_min = self.wordsize_min
-		chars2strip = string.punctuation
+		with open(self.filename,'rb') as fh:
+			size = os.fstat(fh.fileno()).st_size
+			if size == 0: #cannot mmap an empty file
+				buf = b''
+			else:
+				#map the file instead of copying it into a bytes object
+				buf = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+		try:
+			#skip through the line that starts with `start_after`, if any
+			pos = 0
+			if start_after:
+				marker = start_after.encode('ascii')
+				if buf[:len(marker)] != marker:
+					pos = buf.find(b'\n' + marker)
+					pos = size if pos < 0 else pos + 1
+				eol = buf.find(b'\n', pos)
+				pos = size if eol < 0 else eol + 1
+			#tokenize and count in C (regex and Counter), not per word in Python,
+			#one bounded chunk at a time; each chunk ends on a word boundary
+			counts = Counter()
+			word_match = _WORD_RE.match
+			while pos < size:
+				stop = pos + _CHUNK_SIZE
+				if stop < size:
+					word = word_match(buf, stop)  #finish a word cut by `stop`
+					if word:
+						stop = word.end()
+				counts.update(_WORD_RE.findall(buf, pos, stop))
+				pos = stop
+		finally:
+			if size:
+				buf.close()
 		ct_words = 0
 		ct_longwords = 0
-		word_hash = defaultdict(int)
-		with open(self.filename,'r') as fh:
-			for line in fh:
-				while start_after:
-					if line.startswith(start_after):
-						start_after = False
-					continue
-				line.strip()
-				for word in line.split():
-					word = word.strip(chars2strip)
-					if word:
-						ct_words += 1
-					if len(word) >= wordsize_min:
-						ct_longwords += 1
-						word_hash[word] += 1
-		self.word_hash=word_hash
-		self.ct_words=ct_words
-		self.ct_longwords=ct_longwords
+		word_hash = dict()
+		for word, ct in counts.items():
+			ct_words += ct
+			if len(word) >= wordsize_min:
+				ct_longwords += ct
+				word_hash[_as_str(word)] = ct
+		self._word_hash=word_hash
+		self._ct_words=ct_words
+		self._ct_longwords=ct_longwords
 	def summarize(self):
 		freq_min = self.freq_min
 		word_hash = self.word_hash
@@ -64,14 +122,20 @@ class WordFreq:
 			wordsize_min=self.wordsize_min
 			)
 		fmt = "\n%24s %6d"
+		#filter once; both orderings sort only the surviving words
+		acceptable = [(k,v) for k,v in word_hash.items() if v>=freq_min]
 		#create word list in alpha order
-		acceptable = ((k,v) for k,v in word_hash.iteritems() if v>=freq_min)
-		summary['alpha'] = ''.join( fmt%(k,v) for k,v in sorted(acceptable) )
-		#create word list in occurrence order
-		acceptable = ((k,v) for k,v in word_hash.iteritems() if v>=freq_min)
-		summary['occur'] = ''.join(
-			fmt%(k,v)
-			for k,v in sorted(acceptable, key = lambda x: (-x[1], x[0]) ))
+		acceptable.sort()
+		summary['alpha'] = ''.join( fmt%kv for kv in acceptable )
+		#create word list in occurrence order (ties stay in alpha order)
+		top_n = self.top_n
+		if top_n is None:
+			#the sort is stable, so reverse sorting by count keeps alpha ties
+			acceptable.sort(key=itemgetter(1), reverse=True)
+		else:
+			#partial ordering: only the top_n survivors are ever ranked
+			acceptable = heapq.nsmallest(top_n, acceptable, key=lambda kv: (-kv[1], kv[0]))
+		summary['occur'] = ''.join( fmt%kv for kv in acceptable )
 		result = """
 		Results for 'longer' words (length >= %(wordsize_min)d):
 		